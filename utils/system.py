@@ -1,5 +1,484 @@
-import math
-import random as rand
+import concurrent.futures
+import functools
+import heapq
+import itertools
+from collections import deque
+
+import numpy as np
+
+# Threshold above which the scalar recurrence in _active_fraction rescales
+_RESCALE = 1e100
+
+# Event types in the simulators' event heap
+_FAILURE = 0
+_REPAIR = 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _rates(n, k, s, cold):
+    """
+    Per-step failure and repair multipliers for the birth-death chain.
+
+    Step j goes from state j-1 to state j (j = 1..n). The actual rates are
+    these multipliers times lambda and mu, so they only depend on (n, k, s)
+    and are shared by every (lambda, mu) evaluated by the optimizer.
+
+    Returns:
+    tuple: (lam_per_step, mu_per_step) read-only arrays of length n
+    """
+    j = np.arange(1, n + 1)
+
+    if cold:
+        # k active components can fail while the system is up (j-1 ≤ n-k)
+        lam_per_step = np.where(j <= n - k + 1, k, 0).astype(float)
+    else:
+        # All working components can fail: n - j + 1
+        lam_per_step = (n - j + 1).astype(float)
+
+    # Repair rate at state j: min(j, num_repairmen)
+    mu_per_step = np.minimum(j, s).astype(float)
+
+    lam_per_step.flags.writeable = False
+    mu_per_step.flags.writeable = False
+    return lam_per_step, mu_per_step
+
+
+def _birth_death_distribution(ratios):
+    """
+    Stationary distribution of a birth-death chain from its step ratios.
+
+    π(j) is proportional to the product of the first j ratios. The products
+    are accumulated in log space and shifted by their maximum before
+    exponentiating, so long chains with large (or small) ratios neither
+    overflow nor underflow before normalization.
+
+    The chain runs along the last axis, so a stack of chains (one per row)
+    is solved at once.
+
+    Returns:
+    np.ndarray: Stationary probabilities π(0) to π(n)
+    """
+    # Zero ratios (states that cannot be reached) give log π = -inf, i.e. π = 0
+    with np.errstate(divide='ignore'):
+        log_pi = np.cumsum(np.log(ratios), axis=-1)
+    log_pi = np.concatenate((np.zeros(log_pi.shape[:-1] + (1,)), log_pi), axis=-1)
+
+    pi = np.exp(log_pi - log_pi.max(axis=-1, keepdims=True))
+
+    # Normalize probabilities so that they sum to 1
+    return pi / pi.sum(axis=-1, keepdims=True)
+
+
+def _dist_cold_standby(n, k, s, lambda_val, mu):
+    """
+    Calculate the stationary distribution for the cold standby model using a queue.
+
+    In this model:
+    - Only `k` components are active at a time and can fail.
+    - Failure rate at state j (for j ≤ k): (k - j) * lambda
+    - Failure rate at state j (for j > k): 0 -> The system is not active
+    - Repair rate at state j: min(j, num_repairmen) * mu
+
+    Returns:
+    np.ndarray: Stationary probabilities π(0) to π(n)
+    """
+    lam_per_step, mu_per_step = _rates(n, k, s, True)
+
+    # Balance equations: π(j) = π(j-1) * (lambda_j / mu_j)
+    return _birth_death_distribution((lambda_val * lam_per_step) / (mu * mu_per_step))
+
+
+def _dist_warm_standby(n, s, lambda_val, mu):
+    """
+    Calculate the stationary distribution for warm standby model
+
+    In this model:
+    - n is the total number of states (0 to n)
+    - num_repairmen (s) is the threshold parameter for repair capacity
+    - failure_rate (lambda) is the forward transition rate
+    - repair_rate (mu) is the backward transition rate
+
+    Returns:
+    np.ndarray: Stationary probabilities π(0) to π(n)
+    """
+    # Warm standby rates do not depend on k
+    lam_per_step, mu_per_step = _rates(n, 0, s, False)
+
+    # Balance equations: π(j) = π(j-1) * (lambda_j / mu_j)
+    return _birth_death_distribution((lambda_val * lam_per_step) / (mu * mu_per_step))
+
+
+@functools.lru_cache(maxsize=4096)
+def _stationary(n, k, s, lam, mu, cold):
+    """
+    Cached stationary distribution keyed on the system parameters.
+
+    Returns:
+    np.ndarray: Read-only stationary probabilities π(0) to π(n)
+    """
+    if not cold and k != 0:
+        # The warm standby distribution does not depend on k, so every k
+        # shares the array cached under (n, 0, s, lam, mu)
+        return _stationary(n, 0, s, lam, mu, False)
+
+    if cold:
+        pi = _dist_cold_standby(n, k, s, lam, mu)
+    else:
+        pi = _dist_warm_standby(n, s, lam, mu)
+    pi.flags.writeable = False
+    return pi
+
+
+@functools.lru_cache(maxsize=4096)
+def _active_fraction(n, k, s, lam, mu, cold):
+    """
+    Fraction of time the system is active (at most n-k components failed).
+
+    Runs the balance-equation recurrence once over plain floats, summing the
+    active states and all states in the same pass, so no distribution array
+    is built. For the small n evaluated by the optimizer this is several
+    times faster than the NumPy round trip.
+    """
+    ratio = lam / mu
+    lam_per_step, mu_per_step = _rates(n, k, s, cold)
+
+    # Unnormalized π(j), starting from π(0) = 1
+    term = 1.0
+    active = 1.0
+    total = 1.0
+
+    # Plain float lists: indexing NumPy scalars in this loop is much slower
+    for j, failing, repairing in zip(range(1, n + 1), lam_per_step.tolist(), mu_per_step.tolist()):
+        term *= failing * ratio / repairing
+
+        if term > _RESCALE:
+            # Rescale the partial sums so long chains do not overflow
+            active /= term
+            total /= term
+            term = 1.0
+
+        total += term
+        if j <= n - k:
+            active += term
+
+    return active / total
+
+
+def _cost(n, k, r, pi, availability, cold, component_cost, repairmen_cost, downtime_cost):
+    """
+    Cost objective shared by _total_cost and _cost_grid.
+
+    r, availability and the rows of pi may be arrays (one entry per number
+    of repairmen), in which case the cost is computed elementwise.
+
+    Returns:
+    float or np.ndarray: Total cost per unit of time
+    """
+    if cold:
+        C = k * component_cost * availability
+    else:
+        # Expected number of working components: sum of (n-i) * π(i)
+        C = component_cost * (pi @ (n - np.arange(pi.shape[-1])))
+    R = repairmen_cost * r
+    D = downtime_cost * (1 - availability)
+    return C + R + D
+
+
+def _total_cost(n, k, r, lam, mu, cold, component_cost, repairmen_cost, downtime_cost):
+    """
+    Cost per unit of time of a system with n components and r repairmen.
+
+    Returns:
+    tuple: (total cost, availability)
+    """
+    availability = _active_fraction(n, k, r, lam, mu, cold)
+
+    # Only the warm standby component cost needs the full distribution
+    pi = None if cold else _stationary(n, k, r, lam, mu, False)
+    return float(_cost(n, k, r, pi, availability, cold, component_cost, repairmen_cost, downtime_cost)), availability
+
+
+def _cost_grid(k, max_n, max_r, lam, mu, cold, component_cost, repairmen_cost, downtime_cost):
+    """
+    Cost of every system with k ≤ n ≤ max_n components and 1 ≤ r ≤ max_r repairmen.
+
+    The grid is filled one n at a time: the chains of all r for that n are
+    stacked on an (r, state) array and solved together, so each row is a
+    handful of NumPy operations and memory stays O(max_r * max_n).
+
+    Returns:
+    tuple: (total cost, availability) arrays indexed by [n - k, r - 1]
+    """
+    rs = np.arange(1, max_r + 1)
+    cost = np.empty((max_n - k + 1, max_r))
+    availability = np.empty((max_n - k + 1, max_r))
+
+    for i, n in enumerate(range(k, max_n + 1)):
+        # Failure multipliers do not depend on r; repairs at step j: min(j, r)
+        lam_per_step, _ = _rates(n, k, 1, cold)
+        j = np.arange(1, n + 1)
+
+        # Step ratios lambda_j / mu_j, shape (r, step)
+        pi = _birth_death_distribution(lam_per_step * (lam / mu) / np.minimum(j, rs[:, None]))
+
+        availability[i] = pi[:, :n - k + 1].sum(axis=-1)
+
+        cost[i] = _cost(n, k, rs, pi, availability[i], cold, component_cost, repairmen_cost, downtime_cost)
+
+    return cost, availability
+
+
+def _exponential_stream(rng, scale, block=8192):
+    # Draw exponential variates in blocks and hand them out one at a time
+    while True:
+        yield from rng.exponential(scale, block).tolist()
+
+
+def _sim_cold_standby(n, k, s, lam, mu, cycles, warmup_cycles, rng):
+    """
+    Simulate a k-out-of-n system with cold standby components.
+
+    In cold standby:
+    - Only k components are active at any time
+    - Only active components can fail
+    - When an active component fails, a standby component is activated if available
+    - Failed components are repaired by available repairmen
+    - System is not active (no failures can occur) when j ≥ n-k+1 components have failed
+
+    Events are kept in a heap ordered by their absolute time, so the next
+    event is found in O(log n) and no timers need to be updated per cycle.
+
+    Parameters:
+    - cycles: Number of simulation cycles
+    - warmup_cycles: Number of initial cycles to exclude from statistics
+    - rng: np.random.Generator the lifetimes and repair times are drawn from
+
+    Returns:
+    - Fraction of time the system is operational
+    """
+    # Local bindings keep the hot loop free of global and attribute lookups
+    push, pop = heapq.heappush, heapq.heappop
+
+    # Exponential lifetimes and repair times, drawn in blocks
+    next_lifetime = functools.partial(next, _exponential_stream(rng, 1 / lam))
+    next_repair_time = functools.partial(next, _exponential_stream(rng, 1 / mu))
+
+    # Track component states: 0=failed, 1=active, 2=standby (one byte each)
+    components_state = bytearray(1 if i < k else 2 for i in range(n))
+    # Standby components in the order they will be activated
+    standby = deque(range(k, n))
+
+    # Number of failed and active components
+    num_failed = 0
+    num_active = k
+
+    # Failure events are only valid for the up period they were scheduled in:
+    # when the system goes down the active components stop ageing, so all
+    # pending failures are cancelled at once by bumping the generation
+    generation = 0
+
+    # Heap of (absolute_time, seq, component_idx, event_type, generation)
+    events = []
+    seq = itertools.count()
+    for i in range(k):
+        push(events, (next_lifetime(), next(seq), i, _FAILURE, 0))
+
+    # Number of busy repairmen
+    num_in_repair = 0
+    # Queue for failed components waiting for repair
+    repair_queue = deque()
+
+    current_time = 0
+    # Time accumulated after warmup, in total and with the system operational
+    tot_time = 0.0
+    op_time = 0.0
+
+    for c in range(cycles + warmup_cycles):
+        # Determine if system is active (can have failures)
+        is_active = num_failed < (n - k + 1)
+
+        # Find the next event, skipping cancelled failures
+        event_idx = None
+        while events:
+            event_time, _, event_idx, event_type, gen = pop(events)
+            if event_type == _REPAIR or gen == generation:
+                break
+            event_idx = None
+
+        # If no events, break the loop
+        if event_idx is None:
+            break
+
+        # Advance the clock to the event
+        dt = event_time - current_time
+        current_time = event_time
+
+        # Determine system state before the event (operational if at least k components are working)
+        sys_state = 1 if (n - num_failed) >= k else 0
+
+        # Record state if after warmup
+        if c >= warmup_cycles:
+            tot_time += dt
+            if sys_state:
+                op_time += dt
+
+        # Handle the event
+        if event_type == _FAILURE:
+            # Component failed
+            components_state[event_idx] = 0
+            num_failed += 1
+            num_active -= 1
+
+            # Activate a standby component if available and system is still active
+            if is_active and num_failed < (n - k + 1):
+                if standby:
+                    # Activate the first standby component
+                    standby_idx = standby.popleft()
+                    components_state[standby_idx] = 1
+                    num_active += 1
+                    # Schedule the failure of the newly activated component
+                    push(events, (current_time + next_lifetime(), next(seq),
+                                  standby_idx, _FAILURE, generation))
+            else:
+                # System went down: the remaining active components are frozen
+                generation += 1
+
+            # Check if we can start repair immediately
+            if num_in_repair < s:
+                # Start repair immediately
+                push(events, (current_time + next_repair_time(), next(seq),
+                              event_idx, _REPAIR, 0))
+                num_in_repair += 1
+            else:
+                # Add to repair queue
+                repair_queue.append(event_idx)
+
+        elif event_type == _REPAIR:
+            # Component repair completed
+            components_state[event_idx] = 2  # Repaired components go to standby
+            num_failed -= 1
+            num_in_repair -= 1
+
+            # If we're below k active components, activate this one
+            if num_active < k:
+                components_state[event_idx] = 1
+                num_active += 1
+            else:
+                standby.append(event_idx)
+
+            if not is_active:
+                # System restarts: lifetimes are memoryless, so every active
+                # component gets a fresh failure time
+                for i, state in enumerate(components_state):
+                    if state == 1:
+                        push(events, (current_time + next_lifetime(), next(seq),
+                                      i, _FAILURE, generation))
+            elif components_state[event_idx] == 1:
+                push(events, (current_time + next_lifetime(), next(seq),
+                              event_idx, _FAILURE, generation))
+
+            # If there are components waiting, start repairing one
+            if repair_queue:
+                next_component = repair_queue.popleft()
+                push(events, (current_time + next_repair_time(), next(seq),
+                              next_component, _REPAIR, 0))
+                num_in_repair += 1
+
+    # Fraction of time system was operational (after warmup)
+    if tot_time == 0:
+        return 0
+    return op_time / tot_time
+
+
+def _sim_warm_standby(n, k, s, lam, mu, cycles, warmup_cycles, rng):
+    """
+    Simulate a k-out-of-n system with warm standby components.
+
+    All working components can fail. Events are kept in a heap ordered by
+    their absolute time. Lifetimes and repair times are drawn from `rng`.
+
+    Returns:
+    - Fraction of time the system is operational
+    """
+    # Local bindings keep the hot loop free of global and attribute lookups
+    push, pop = heapq.heappush, heapq.heappop
+
+    # Exponential lifetimes and repair times, drawn in blocks
+    next_lifetime = functools.partial(next, _exponential_stream(rng, 1 / lam))
+    next_repair_time = functools.partial(next, _exponential_stream(rng, 1 / mu))
+
+    # Number of working components (the heap holds which ones)
+    num_working = n
+
+    # Heap of (absolute_time, seq, component_idx, event_type): every working
+    # component has one pending failure, every component in repair one repair
+    events = []
+    seq = itertools.count()
+    for i in range(n):
+        push(events, (next_lifetime(), next(seq), i, _FAILURE))
+
+    # Number of busy repairmen
+    num_in_repair = 0
+    # Queue for failed components waiting for repair
+    repair_queue = deque()
+
+    current_time = 0
+    # Time accumulated after warmup, in total and with the system operational
+    tot_time = 0.0
+    op_time = 0.0
+
+    for c in range(cycles+1):
+        # If no events, break the loop
+        if not events:
+            break
+
+        # Find the next event
+        event_time, _, event_idx, event_type = pop(events)
+
+        # Advance the clock to the event
+        dt = event_time - current_time
+        current_time = event_time
+
+        # Determine system state before the event
+        sys_state = 1 if num_working >= k else 0
+
+        # Record state if after warmup
+        if c > warmup_cycles:
+            tot_time += dt
+            if sys_state:
+                op_time += dt
+
+        # Handle the event
+        if event_type == _FAILURE:
+            # Component failed
+            num_working -= 1
+
+            # Check if we can start repair immediately
+            if num_in_repair < s:
+                # Start repair immediately
+                push(events, (current_time + next_repair_time(), next(seq), event_idx, _REPAIR))
+                num_in_repair += 1
+            else:
+                # Add to repair queue
+                repair_queue.append(event_idx)
+
+        elif event_type == _REPAIR:
+            # Component repair completed
+            num_working += 1
+            push(events, (current_time + next_lifetime(), next(seq), event_idx, _FAILURE))
+            num_in_repair -= 1
+
+            # If there are components waiting, start repairing one
+            if repair_queue:
+                next_component = repair_queue.popleft()
+                push(events, (current_time + next_repair_time(), next(seq), next_component, _REPAIR))
+                num_in_repair += 1
+
+    # Fraction of time system was operational (after warmup)
+    if tot_time == 0:
+        return 0
+    return op_time / tot_time
+
 
 class System:
 
@@ -13,387 +492,82 @@ class System:
         self.cold_standby = cold_standby
 
     def __dist_cold_standby__(self):
-        """
-        Calculate the stationary distribution for the cold standby model using a queue.
-        
-        In this model:
-        - Only `k` components are active at a time and can fail.
-        - Failure rate at state j (for j ≤ k): (k - j) * lambda
-        - Failure rate at state j (for j > k): 0 -> The system is not active
-        - Repair rate at state j: min(j, num_repairmen) * mu
-        
-        Returns:
-        list: List of stationary probabilities π(0) to π(n)
-        """
-        n = self.n  # Total number of components
-        k = self.k  # Number of active components
-        s = self.num_repairmen
-        lambda_val = self.lambda_val
-        mu = self.mu
-        
-        # Initialize probability queue
-        pi = [0] * (n + 1)
-        
-        # Base case: π(0)
-        pi[0] = 1  # Normalization factor will be applied later
-        
-        # Compute π(j) recursively using balance equations
-        for j in range(1, n + 1):
-            if j <= n-k+1:
-                lambda_j = k * lambda_val  # Failure rate at state j-1
-            else:
-                lambda_j = 0 # Constant failure rate for j > k
-            
-            mu_j = min(j, s) * mu  # Repair rate at state j
-            
-            pi[j] = pi[j - 1] * (lambda_j / mu_j)
-        
-        # Normalize probabilities so that they sum to 1
-        pi_sum = sum(pi)
-        pi = [p / pi_sum for p in pi]
-        
-        return list(pi)
+        return _stationary(self.n, self.k, self.num_repairmen,
+                           self.lambda_val, self.mu, True)
 
-    
     def __dist_warm_standby__(self):
+        return _stationary(self.n, self.k, self.num_repairmen,
+                           self.lambda_val, self.mu, False)
+
+    def __sim_cold_standby__(self, cycles=10000, warmup_cycles=1000, seed=42, rng=None):
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        return _sim_cold_standby(self.n, self.k, self.num_repairmen, self.lambda_val,
+                                 self.mu, cycles, warmup_cycles, rng)
+
+    def __sim_warm_standby__(self, cycles=10000, warmup_cycles=1000, seed=42, rng=None):
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        return _sim_warm_standby(self.n, self.k, self.num_repairmen, self.lambda_val,
+                                 self.mu, cycles, warmup_cycles, rng)
+
+    def sim(self, cycles=10000, warmup_cycles=1000, seed=42, rng=None):
         """
-        Calculate the stationary distribution for warm standby model
-        
-        In this model:
-        - n is the total number of states (0 to n)
-        - num_repairmen (s) is the threshold parameter for repair capacity
-        - failure_rate (lambda) is the forward transition rate
-        - repair_rate (mu) is the backward transition rate
-        
-        Returns:
-        list: List of stationary probabilities π(0) to π(n)
-        """
-        n = self.n
-        s = self.num_repairmen
-        lambda_val = self.lambda_val
-        mu = self.mu
-        
-        # Calculate lambda/mu ratio once to avoid repeated division
-        lambda_mu_ratio = lambda_val / mu
-        
-        # Calculate pi(0)^(-1)
-        pi_0_inverse = 0
-        
-        # First sum for j ≤ s
-        for j in range(s + 1):
-            pi_0_inverse += math.comb(n, j) * (lambda_mu_ratio ** j)
-        
-        # Precompute factorial values we'll need repeatedly
-        n_factorial = math.factorial(n)
-        s_factorial = math.factorial(s)
-        
-        # Second sum for j > s
-        for j in range(s + 1, n + 1):
-            denominator = math.factorial(n - j) * s_factorial * (s ** (j - s))
-            pi_0_inverse += (n_factorial / denominator) * (lambda_mu_ratio ** j)
-        
-        # Calculate π(0)
-        pi_0 = 1 / pi_0_inverse
-        
-        # Initialize list for all probabilities
-        pi = [0] * (n + 1)
-        pi[0] = pi_0
-        
-        # Calculate π(j) for j ≤ s
-        for j in range(1, min(s + 1, n)):
-            pi[j] = math.comb(n, j) * (lambda_mu_ratio ** j) * pi_0
-        
-        # Calculate π(j) for j > s
-        for j in range(s + 1, n + 1):
-            denominator = math.factorial(n - j) * s_factorial * (s ** (j - s))
-            pi[j] = (n_factorial / denominator) * (lambda_mu_ratio ** j) * pi_0
-        
-        return pi
-    
-    def __sim_cold_standby__(self, cycles=10000, warmup_cycles=1000, seed=42):
-        """
-        Simulate a k-out-of-n system with cold standby components.
-        
-        In cold standby:
-        - Only k components are active at any time
-        - Only active components can fail
-        - When an active component fails, a standby component is activated if available
-        - Failed components are repaired by available repairmen
-        - System is not active (no failures can occur) when j ≥ n-k+1 components have failed
-        
+        Simulate a k-out-of-n system based on the cold_standby parameter.
+
         Parameters:
         - cycles: Number of simulation cycles
         - warmup_cycles: Number of initial cycles to exclude from statistics
-        - seed: Random seed for reproducibility
-        
+        - seed: Random seed for reproducibility, used when no `rng` is given
+        - rng: np.random.Generator to draw from, so a long-lived stream can be
+          shared by successive simulations instead of reseeding each call
+
         Returns:
         - Fraction of time the system is operational
         """
-        # Function for generating random exponential lifetimes/repair times
-        rand_exp = lambda mu: -math.log(rand.random()) / mu
-
-        # Random seed for replication
-        rand.seed(seed)
-        
-        # Track component states: 0=failed, 1=active, 2=standby
-        components_state = [1 if i < self.k else 2 for i in range(self.n)]
-        
-        # Number of failed components
-        num_failed = 0
-        
-        # Remaining lifetime vector (only for active components)
-        lifetimes = [rand_exp(self.lambda_val) if components_state[i] == 1 else float('inf') 
-                    for i in range(self.n)]
-        
-        # Track which components are being repaired and their remaining repair times
-        in_repair = {}  # {component_idx: remaining_repair_time}
-        # Queue for failed components waiting for repair
-        repair_queue = []
-        
-        system_state = {'t': [], 'state': [], 'comp': [], 'queue_length': [], 'waiting_time': []}
-        
-        current_time = 0
-        total_waiting_time = 0
-        num_repairs = 0
-        
-        for c in range(cycles + warmup_cycles):
-            # Determine if system is active (can have failures)
-            is_active = num_failed < (self.n - self.k + 1)
-            
-            # Collect all event times (only failures if system is active)
-            event_times = []
-            if is_active:
-                event_times = [(i, t, "failure") for i, t in enumerate(lifetimes) 
-                            if components_state[i] == 1 and t < float('inf')]
-            event_times.extend([(i, t, "repair") for i, t in in_repair.items()])
-            
-            # If no events, break the loop
-            if not event_times:
-                break
-                
-            # Find the next event
-            event_idx, dt, event_type = min(event_times, key=lambda x: x[1])
-            
-            # Update current time
-            current_time += dt
-            
-            # Update all timers
-            if is_active:
-                lifetimes = [max(0, l - dt) if components_state[i] == 1 else l 
-                            for i, l in enumerate(lifetimes)]
-            in_repair = {i: max(0, t - dt) for i, t in in_repair.items()}
-            
-            # Determine system state before the event (operational if at least k components are working)
-            sys_state = 1 if (self.n - num_failed) >= self.k else 0
-            
-            # Record state if after warmup
-            if c >= warmup_cycles:
-                system_state['t'].append(dt)
-                system_state['state'].append(sys_state)
-                system_state['comp'].append(components_state.copy())
-                system_state['queue_length'].append(len(repair_queue))
-                
-                # Calculate average waiting time so far
-                avg_wait = total_waiting_time / max(1, num_repairs)
-                system_state['waiting_time'].append(avg_wait)
-            
-            # Handle the event
-            if event_type == "failure":
-                # Component failed
-                components_state[event_idx] = 0
-                num_failed += 1
-                
-                # Activate a standby component if available and system is still active
-                if is_active and num_failed < (self.n - self.k + 1):
-                    standby_components = [i for i, state in enumerate(components_state) if state == 2]
-                    if standby_components:
-                        # Activate the first standby component
-                        standby_idx = standby_components[0]
-                        components_state[standby_idx] = 1
-                        # Set a new lifetime for the newly activated component
-                        lifetimes[standby_idx] = rand_exp(self.lambda_val)
-                
-                # Check if we can start repair immediately
-                if len(in_repair) < self.num_repairmen:
-                    # Start repair immediately
-                    repair_time = rand_exp(self.mu)
-                    in_repair[event_idx] = repair_time
-                    waiting_time = 0
-                else:
-                    # Add to repair queue
-                    repair_queue.append(event_idx)
-                    waiting_time = 0  # Initial waiting time, will be updated when repair starts
-                
-                # Update stats
-                total_waiting_time += waiting_time
-                num_repairs += 1
-                
-            elif event_type == "repair":
-                # Component repair completed
-                components_state[event_idx] = 2  # Repaired components go to standby
-                num_failed -= 1
-                
-                # If we're below k active components, activate this one
-                active_count = sum(1 for state in components_state if state == 1)
-                if active_count < self.k:
-                    components_state[event_idx] = 1
-                    lifetimes[event_idx] = rand_exp(self.lambda_val)
-                
-                # Remove from in_repair
-                del in_repair[event_idx]
-                
-                # If there are components waiting, start repairing one
-                if repair_queue:
-                    next_component = repair_queue.pop(0)
-                    repair_time = rand_exp(self.mu)
-                    in_repair[next_component] = repair_time
-                    
-                    # Update waiting time for this component
-                    waiting_time = current_time - (current_time - dt)  # Simplified
-                    total_waiting_time += waiting_time
-        
-        # Calculate results only from the recorded states (after warmup)
-        tot_time = sum(system_state['t'])
-        if tot_time == 0:
-            return 0
-            
-        # Fraction of time system was operational
-        operational_time = sum(t for t, s in zip(system_state['t'], system_state['state']) if s == 1)
-        return operational_time / tot_time
-    
-    def __sim_warm_standby__(self, cycles=10000, warmup_cycles=1000, seed=42):
-        # Function for generating random exponential lifetimes
-        rand_exp = lambda mu: -math.log(rand.random()) / mu
+        if self.cold_standby:
+            return self.__sim_cold_standby__(cycles, warmup_cycles, seed, rng)
+        else:
+            return self.__sim_warm_standby__(cycles, warmup_cycles, seed, rng)
 
-        # Random seed for replication
-        rand.seed(seed)
-        
-        # Remaining lifetime vector
-        lifetimes = [rand_exp(self.lambda_val) for _ in range(self.n)]
-        # State vector (1 = working, 0 = failed)
-        components_state = [1]*self.n
-        
-        # Track which components are being repaired and their remaining repair times
-        in_repair = {}  # {component_idx: remaining_repair_time}
-        # Queue for failed components waiting for repair
-        repair_queue = []
-        
-        system_state = {'t':[], 'state':[], 'comp':[], 'queue_length':[], 'waiting_time':[]}
-        
-        current_time = 0
-        total_waiting_time = 0
-        num_repairs = 0
-        
-        for c in range(cycles+1):
-            # Collect all event times (failures and repair completions)
-            event_times = [(i, t, "failure") for i, t in enumerate(lifetimes) if components_state[i] == 1]
-            event_times.extend([(i, t, "repair") for i, t in in_repair.items()])
-            
-            # If no events, break the loop
-            if not event_times:
-                break
-                
-            # Find the next event
-            event_idx, dt, event_type = min(event_times, key=lambda x: x[1])
-            
-            # Update current time
-            current_time += dt
-            
-            # Update all timers
-            lifetimes = [max(0, l-dt) if components_state[i] == 1 else l for i, l in enumerate(lifetimes)]
-            in_repair = {i: max(0, t-dt) for i, t in in_repair.items()}
-            
-            # Determine system state before the event
-            sys_state = 1 if sum(components_state) >= self.k else 0
-            
-            # Record state if after warmup
-            if c > warmup_cycles:
-                system_state['t'].append(dt)
-                system_state['state'].append(sys_state)
-                system_state['comp'].append(components_state.copy())
-                system_state['queue_length'].append(len(repair_queue))
-                
-                # Calculate average waiting time so far
-                avg_wait = total_waiting_time / max(1, num_repairs)
-                system_state['waiting_time'].append(avg_wait)
-            
-            # Handle the event
-            if event_type == "failure":
-                # Component failed
-                components_state[event_idx] = 0
-                
-                # Check if we can start repair immediately
-                if len(in_repair) < self.num_repairmen:
-                    # Start repair immediately
-                    repair_time = rand_exp(self.mu)
-                    in_repair[event_idx] = repair_time
-                    waiting_time = 0
-                else:
-                    # Add to repair queue
-                    repair_queue.append(event_idx)
-                    waiting_time = 0  # Initial waiting time, will be updated when repair starts
-                
-                # Update stats
-                total_waiting_time += waiting_time
-                num_repairs += 1
-                
-            elif event_type == "repair":
-                # Component repair completed
-                components_state[event_idx] = 1
-                lifetimes[event_idx] = rand_exp(self.lambda_val)
-                
-                # Remove from in_repair
-                del in_repair[event_idx]
-                
-                # If there are components waiting, start repairing one
-                if repair_queue:
-                    next_component = repair_queue.pop(0)
-                    repair_time = rand_exp(self.mu)
-                    in_repair[next_component] = repair_time
-                    
-                    # Update waiting time for this component
-                    # (waiting time is from failure to start of repair)
-                    waiting_time = dt  # This is a simplification, actual time would need more tracking
-                    total_waiting_time += waiting_time
-        
-        tot_time = sum(system_state['t'])
-        if tot_time == 0:
-            return 0, 0, 0, system_state
-            
-        frac_time = [(t/tot_time)*system_state['state'][i] for i,t in enumerate(system_state['t'])]
-        
-        #avg_queue_length = sum(ql * t for ql, t in zip(system_state['queue_length'], system_state['t'])) / tot_time
-        #avg_waiting_time = sum(system_state['waiting_time']) / len(system_state['waiting_time']) if system_state['waiting_time'] else 0
-        
-        return sum(frac_time)#, avg_queue_length, avg_waiting_time, system_state
-    
-    def sim(self, cycles=10000, warmup_cycles=1000, seed=42):
+    def sim_replications(self, replications=10, cycles=10000, warmup_cycles=1000, seed=42, max_workers=None, rng=None):
         """
-        Simulate a k-out-of-n system based on the cold_standby parameter.
+        Run independent replications of the simulation in parallel processes.
+
+        Each replication gets its own generator spawned from `rng` (or from
+        `seed`), so the results are reproducible and the streams do not overlap.
 
         Parameters:
-        - cycles: Number of simulation cycles
+        - replications: Number of independent replications
+        - cycles: Number of simulation cycles per replication
         - warmup_cycles: Number of initial cycles to exclude from statistics
-        - seed: Random seed for reproducibility
+        - seed: Random seed for reproducibility, used when no `rng` is given
+        - max_workers: Number of worker processes (default: number of CPUs)
+        - rng: np.random.Generator the replication streams are spawned from
 
         Returns:
-        - Fraction of time the system is operational
+        - np.ndarray: Fraction of time the system is operational, per replication
         """
-        if self.cold_standby:
-            return self.__sim_cold_standby__(cycles, warmup_cycles, seed)
-        else:
-            return self.__sim_warm_standby__(cycles, warmup_cycles, seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
+
+        kernel = _sim_cold_standby if self.cold_standby else _sim_warm_standby
+        rngs = rng.spawn(replications)
+        params = (self.n, self.k, self.num_repairmen, self.lambda_val, self.mu, cycles, warmup_cycles)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            fractions = executor.map(kernel, *(itertools.repeat(p, replications) for p in params), rngs)
+            return np.fromiter(fractions, dtype=float, count=replications)
   
     def stationary_distribution(self):
-        # Compute stationary distribution
-        if self.cold_standby:
-            return self.__dist_cold_standby__()
-        else:
-            return self.__dist_warm_standby__()
+        # Compute stationary distribution (cached per parameters)
+        return _stationary(self.n, self.k, self.num_repairmen,
+                           self.lambda_val, self.mu, self.cold_standby)
         
     def active_time_fraction(self):
-        # Considering the system active when only a
-        return sum([p_i for i, p_i in enumerate(self.stationary_distribution()) if i<=self.n-self.k])
+        # Considering the system active when at most n-k components are failed
+        return _active_fraction(self.n, self.k, self.num_repairmen,
+                                self.lambda_val, self.mu, self.cold_standby)
     
 
     """
@@ -408,47 +582,39 @@ class System:
     $$ R + i\times C_i\times T_{up} + D\times (1-T_{up})$$
     """
     def total_cost(self, n, r, component_cost, repairmen_cost, downtime_cost):
+        return _total_cost(n, self.k, r, self.lambda_val, self.mu, self.cold_standby,
+                           component_cost, repairmen_cost, downtime_cost)
 
-        sys = System(n, self.k, r, self.mu, self.lambda_val, self.cold_standby)
+    def __optimize_grid__(self, max_n, max_repairmen, component_cost, repairmen_cost, downtime_cost):
+        # Exhaustive search: evaluate the cost of every (n, r) pair at once
+        cost, availability = _cost_grid(self.k, max_n, max_repairmen, self.lambda_val, self.mu,
+                                        self.cold_standby, component_cost, repairmen_cost, downtime_cost)
 
-        availability = sys.active_time_fraction()
+        a, b = np.unravel_index(np.argmin(cost), cost.shape)
 
-        if self.cold_standby:
-            C = self.k * component_cost * availability
-            R = repairmen_cost * r
-            D = downtime_cost * (1-availability)
-            return C+R+D, availability
-        else:
-            C=0
-            pi = sys.__dist_warm_standby__()
-            for i in range(len(pi)):
-                C += (n-i) * pi[i] * component_cost
-            R = repairmen_cost  * r
-            D = downtime_cost * (1-availability)
-            return C+R+D, availability
+        return {
+            "components": self.k + int(a),
+            "repairmen": 1 + int(b),
+            "availability": float(availability[a, b]),
+            "total_cost": float(cost[a, b])
+        }
 
     def optimize(self, max_n, max_repairmen, component_cost, repairmen_cost, downtime_cost):
+        """
+        Find the number of components and repairmen with the lowest total cost.
+
+        Every k ≤ n ≤ max_n and 1 ≤ r ≤ max_repairmen is evaluated with
+        _cost_grid; ties go to the smallest n, then the smallest r.
+        """
         opt_result =  {'components':None, 'repairmen':None, 'availability':None, 'total_cost':None}
 
         if component_cost is None or repairmen_cost is None or downtime_cost is None:
             return opt_result
         
-        lowest_cost = math.inf
-        
-        for n in range(self.k, max_n + 1):
-            for r in range(1, max_repairmen + 1):
-                cost, availability = self.total_cost(n, r, component_cost, repairmen_cost, downtime_cost)
-
-                if cost <= lowest_cost:
-                    lowest_cost = cost
-                    opt_result = {
-                        "components": n,
-                        "repairmen": r,
-                        "availability": availability,
-                        "total_cost": cost
-                    }
-
-        return opt_result
+        if max_n < self.k or max_repairmen < 1:
+            return opt_result
+
+        return self.__optimize_grid__(max_n, max_repairmen, component_cost, repairmen_cost, downtime_cost)
 
 if __name__ == "__main__":
     sys = System(n=5, k=3, num_repairmen=3, 
@@ -1,5 +1,5 @@
 import unittest
-from system import System  # Assuming the class is saved in system.py
+from system import System, _cost_grid  # Assuming the class is saved in system.py
 
 class TestSystemModel(unittest.TestCase):
     # Tolerance for comparing analytical vs simulation results
@@ -21,19 +21,27 @@ class TestSystemModel(unittest.TestCase):
         (5, 3, 2, 5.0, 1.0),
     ]
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the warm and cold standby system of every test case once, keyed on (case_idx, cold_standby)."""
+        cls.systems = {
+            (case_idx, standby_mode): System(
+                n=n,
+                k=k,
+                num_repairmen=num_repairmen,
+                failure_rate=failure_rate,
+                repair_rate=repair_rate,
+                cold_standby=standby_mode
+            )
+            for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(cls.TEST_CASES)
+            for standby_mode in [False, True]
+        }
+
     def test_warm_standby_consistency(self):
         """Test that analytical and simulation results are consistent for warm standby systems."""
         for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES):
             with self.subTest(case=f"Case {case_idx+1}: n={n}, k={k}, s={num_repairmen}, λ={failure_rate}, μ={repair_rate}"):
-                # Create system instance
-                system = System(
-                    n=n,
-                    k=k,
-                    num_repairmen=num_repairmen,
-                    failure_rate=failure_rate,
-                    repair_rate=repair_rate,
-                    cold_standby=False
-                )
+                system = self.systems[case_idx, False]
                 
                 # Get analytical result
                 analytical_result = round(system.active_time_fraction(), 4)
@@ -66,15 +74,7 @@ class TestSystemModel(unittest.TestCase):
         """Test that analytical and simulation results are consistent for cold standby systems."""
         for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES):
             with self.subTest(case=f"Case {case_idx+1}: n={n}, k={k}, s={num_repairmen}, λ={failure_rate}, μ={repair_rate}"):
-                # Create system instance
-                system = System(
-                    n=n,
-                    k=k,
-                    num_repairmen=num_repairmen,
-                    failure_rate=failure_rate,
-                    repair_rate=repair_rate,
-                    cold_standby=True
-                )
+                system = self.systems[case_idx, True]
                 
                 # Get analytical result
                 analytical_result = round(system.active_time_fraction(), 4)
@@ -109,14 +109,7 @@ class TestSystemModel(unittest.TestCase):
             standby_type = "Cold" if standby_mode else "Warm"
             for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES):
                 with self.subTest(case=f"{standby_type} Standby Case {case_idx+1}"):
-                    system = System(
-                        n=n,
-                        k=k,
-                        num_repairmen=num_repairmen,
-                        failure_rate=failure_rate,
-                        repair_rate=repair_rate,
-                        cold_standby=standby_mode
-                    )
+                    system = self.systems[case_idx, standby_mode]
                     distribution = system.stationary_distribution()
                     total_prob = sum(distribution)
                     
@@ -132,25 +125,8 @@ class TestSystemModel(unittest.TestCase):
         for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES):
             if n > k:  # Only compare if there are standby components
                 with self.subTest(case=f"Case {case_idx+1}: n={n}, k={k}, s={num_repairmen}, λ={failure_rate}, μ={repair_rate}"):
-                    # Create warm standby system
-                    warm_system = System(
-                        n=n,
-                        k=k,
-                        num_repairmen=num_repairmen,
-                        failure_rate=failure_rate,
-                        repair_rate=repair_rate,
-                        cold_standby=False
-                    )
-                    
-                    # Create cold standby system
-                    cold_system = System(
-                        n=n,
-                        k=k,
-                        num_repairmen=num_repairmen,
-                        failure_rate=failure_rate,
-                        repair_rate=repair_rate,
-                        cold_standby=True
-                    )
+                    warm_system = self.systems[case_idx, False]
+                    cold_system = self.systems[case_idx, True]
                     
                     # Get reliability metrics (active time fraction)
                     warm_reliability = warm_system.active_time_fraction()
@@ -168,5 +144,105 @@ class TestSystemModel(unittest.TestCase):
                         f"Case {case_idx+1}: Cold standby reliability ({cold_reliability:.6f}) is not greater than or equal to warm standby reliability ({warm_reliability:.6f})"
                     )
 
+    def test_sim_replications(self):
+        """Test that independent replications agree with the analytical result and use different random streams."""
+        for standby_mode in [False, True]:
+            standby_type = "Cold" if standby_mode else "Warm"
+            for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES):
+                with self.subTest(case=f"{standby_type} Standby Case {case_idx+1}"):
+                    system = self.systems[case_idx, standby_mode]
+                    analytical_result = system.active_time_fraction()
+                    replications = system.sim_replications(replications=4, cycles=100000, warmup_cycles=1000)
+
+                    self.assertEqual(len(set(replications)), 4, f"{standby_type} Standby Case {case_idx+1}: replications are not independent")
+
+                    relative_difference = abs(replications.mean() - analytical_result) / analytical_result
+                    self.assertLess(
+                        relative_difference,
+                        self.TOLERANCE,
+                        f"{standby_type} standby case {case_idx+1}: Relative difference {relative_difference*100:.2f}% exceeds tolerance of {self.TOLERANCE*100}%"
+                    )
+
+    def test_total_cost_availability(self):
+        """Test that total_cost uses the availability of the system with n components and r repairmen."""
+        for standby_mode in [False, True]:
+            standby_type = "Cold" if standby_mode else "Warm"
+            for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES):
+                with self.subTest(case=f"{standby_type} Standby Case {case_idx+1}"):
+                    system = System(
+                        n=k,
+                        k=k,
+                        num_repairmen=1,
+                        failure_rate=failure_rate,
+                        repair_rate=repair_rate,
+                        cold_standby=standby_mode
+                    )
+                    expected_system = self.systems[case_idx, standby_mode]
+                    _, availability = system.total_cost(n, num_repairmen, 10.0, 50.0, 100.0)
+
+                    self.assertAlmostEqual(
+                        availability,
+                        expected_system.active_time_fraction(),
+                        places=12,
+                        msg=f"{standby_type} Standby Case {case_idx+1}: total_cost availability {availability} differs from the system availability"
+                    )
+
+    def test_cost_grid_matches_total_cost(self):
+        """Test that every cell of the vectorized cost grid matches total_cost."""
+        # (component cost, repairman cost, downtime cost)
+        cost_cases = [(20.0, 20.0, 50.0), (10.0, 50.0, 100.0), (1.0, 5.0, 1000.0)]
+        for standby_mode in [False, True]:
+            standby_type = "Cold" if standby_mode else "Warm"
+            for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES):
+                for component_cost, repairmen_cost, downtime_cost in cost_cases:
+                    with self.subTest(case=f"{standby_type} Standby Case {case_idx+1}: costs=({component_cost}, {repairmen_cost}, {downtime_cost})"):
+                        system = self.systems[case_idx, standby_mode]
+                        max_n, max_repairmen = n + 5, n
+                        cost, availability = _cost_grid(k, max_n, max_repairmen, failure_rate, repair_rate, standby_mode,
+                                                        component_cost, repairmen_cost, downtime_cost)
+
+                        for grid_n in range(k, max_n + 1):
+                            for r in range(1, max_repairmen + 1):
+                                expected_cost, expected_availability = system.total_cost(grid_n, r, component_cost, repairmen_cost, downtime_cost)
+                                self.assertAlmostEqual(cost[grid_n - k, r - 1], expected_cost, places=9,
+                                                       msg=f"{standby_type} Standby Case {case_idx+1}: cost differs at n={grid_n}, r={r}")
+                                self.assertAlmostEqual(availability[grid_n - k, r - 1], expected_availability, places=12,
+                                                       msg=f"{standby_type} Standby Case {case_idx+1}: availability differs at n={grid_n}, r={r}")
+
+    def _exhaustive_search(self, system, max_n, max_repairmen, component_cost, repairmen_cost, downtime_cost):
+        """Reference optimum: evaluate total_cost cell by cell, keeping the smallest (n, r) on ties."""
+        best = None
+        for n in range(system.k, max_n + 1):
+            for r in range(1, max_repairmen + 1):
+                cost, _ = system.total_cost(n, r, component_cost, repairmen_cost, downtime_cost)
+                if best is None or cost < best[0]:
+                    best = (cost, n, r)
+        return best
+
+    def test_optimize_large_grid(self):
+        """Test that the optimizer finds the exact optimum of large warm standby grids."""
+        # (component cost, repairman cost, downtime cost)
+        cost_cases = [(20.0, 20.0, 50.0), (10.0, 50.0, 100.0), (1.0, 5.0, 1000.0)]
+        # Cold standby is left out: its cost is linear in the availability, so on
+        # large grids the optimum lies on a plateau that is flat up to round-off
+        cases = [(self.systems[case_idx, False], n + 60, 60, costs)
+                 for case_idx, (n, k, num_repairmen, failure_rate, repair_rate) in enumerate(self.TEST_CASES)
+                 for costs in cost_cases]
+        # Far-away configuration with a cost within 2e-7 (relative) of the optimum
+        cases.append((System(1, 1, 1, 4.418951086567625, 0.8451911671135501, False), 81, 60,
+                      (34.1250727951367, 24.46103533692155, 249.9140772600572)))
+
+        for case_idx, (system, max_n, max_repairmen, costs) in enumerate(cases):
+            with self.subTest(case=f"Warm Standby Case {case_idx+1}: max_n={max_n}, costs={costs}"):
+                result = system.optimize(max_n, max_repairmen, *costs)
+                expected_cost, expected_n, expected_r = self._exhaustive_search(system, max_n, max_repairmen, *costs)
+
+                self.assertEqual(
+                    (result['components'], result['repairmen']),
+                    (expected_n, expected_r),
+                    f"Warm Standby Case {case_idx+1}: optimize found {result} instead of n={expected_n}, r={expected_r}"
+                )
+                self.assertAlmostEqual(result['total_cost'], expected_cost, places=9)
+
 if __name__ == "__main__":
     unittest.main(argv=[''], exit=False)
\ No newline at end of file